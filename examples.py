@@ -4,217 +4,242 @@
 BitQiu Client Usage Examples
 
 This file demonstrates how to use the BitQiu client for various operations.
+
+The client itself is synchronous; the examples run its blocking calls in worker
+threads via ``asyncio.to_thread`` so that independent requests can overlap.
+Concurrent examples collect their output and print it in one block when they
+finish, so their numbered steps don't interleave.
 """
 
 import asyncio
-from mcp_bitqiu import BitQiuClient
+from itertools import islice
+from typing import List
+
+from mcp_bitqiu import BitQiuClient, FileResource
+
 
+async def example_basic_usage(client: BitQiuClient) -> List[FileResource]:
+    """
+    Example of basic BitQiu client usage.
 
-async def example_basic_usage():
-    """Example of basic BitQiu client usage."""
+    Returns the root directory listing so the other examples can reuse it.
+    """
     print("=== Basic BitQiu Client Usage ===")
-    
-    # Create client with context manager for automatic cleanup
-    with BitQiuClient() as client:
+
+    resources: List[FileResource] = []
+    try:
+        # Step 1: Authenticate
+        print("1. Authenticating with BitQiu...")
+        await asyncio.to_thread(client.authenticate_with_qr_code)
+
+        # Step 2: Get user information
+        print("2. Getting user information...")
+        user_info = await asyncio.to_thread(client.get_user_info)
+        print(f"   User ID: {user_info.user_id}")
+        print(f"   Root directory: {user_info.root_dir_id}")
+        print(f"   Privileged gear: {user_info.privilege.privileged_gear_name}")
+        print(f"   Downloads remaining: {user_info.privilege.cloud_download_count_remain}")
+        print(f"   Video plays remaining: {user_info.privilege.cloud_video_play_count_remain}")
+
+        # Step 3: List resources in root directory
+        print("3. Listing resources in root directory...")
+        # Only names, sizes and types are shown, so skip timestamp parsing
+        resources = await asyncio.to_thread(client.list_resources, parse_times=False)
+        print(f"   Found {len(resources)} resources:")
+        for i, resource in enumerate(islice(resources, 10)):  # Show first 10
+            prefix = "[DIR]" if resource.is_directory else "[FILE]"
+            size_str = f" ({resource.size} bytes)" if not resource.is_directory else ""
+            print(f"   {i+1:2d}. {prefix} {resource.name}{size_str}")
+
+        # Step 4: Create a test directory
+        print("4. Creating a test directory...")
+        test_dir = await asyncio.to_thread(client.create_directory, "Test Directory")
+        print(f"   Created directory: {test_dir.name} (ID: {test_dir.dir_id})")
+
+        # Step 5: List directories only
+        print("5. Listing directories...")
+        directories = await asyncio.to_thread(client.list_directories)
+        print(f"   Found {len(directories)} directories:")
+        for i, directory in enumerate(directories[:5]):  # Show first 5
+            print(f"   {i+1:2d}. {directory.name} (ID: {directory.dir_id})")
+
+        # Step 6: Daily sign-in
+        print("6. Performing daily sign-in...")
         try:
-            # Step 1: Authenticate
-            print("1. Authenticating with BitQiu...")
-            client.authenticate_with_qr_code()
-            
-            # Step 2: Get user information
-            print("2. Getting user information...")
-            user_info = client.get_user_info()
-            print(f"   User ID: {user_info.user_id}")
-            print(f"   Root directory: {user_info.root_dir_id}")
-            print(f"   Privileged gear: {user_info.privilege.privileged_gear_name}")
-            print(f"   Downloads remaining: {user_info.privilege.cloud_download_count_remain}")
-            print(f"   Video plays remaining: {user_info.privilege.cloud_video_play_count_remain}")
-            
-            # Step 3: List resources in root directory
-            print("3. Listing resources in root directory...")
-            resources = client.list_resources()
-            print(f"   Found {len(resources)} resources:")
-            for i, resource in enumerate(resources[:10]):  # Show first 10
-                prefix = "[DIR]" if resource.is_directory else "[FILE]"
-                size_str = f" ({resource.size} bytes)" if not resource.is_directory else ""
-                print(f"   {i+1:2d}. {prefix} {resource.name}{size_str}")
-            
-            # Step 4: Create a test directory
-            print("4. Creating a test directory...")
-            test_dir = client.create_directory("Test Directory")
-            print(f"   Created directory: {test_dir.name} (ID: {test_dir.dir_id})")
-            
-            # Step 5: List directories only
-            print("5. Listing directories...")
-            directories = client.list_directories()
-            print(f"   Found {len(directories)} directories:")
-            for i, directory in enumerate(directories[:5]):  # Show first 5
-                print(f"   {i+1:2d}. {directory.name} (ID: {directory.dir_id})")
-            
-            # Step 6: Daily sign-in
-            print("6. Performing daily sign-in...")
-            try:
-                client.daily_signin()
-                print("   Daily sign-in successful!")
-            except Exception as e:
-                print(f"   Daily sign-in failed: {e}")
-            
-            print("\n✅ Basic usage example completed successfully!")
-            
+            await asyncio.to_thread(client.daily_signin)
+            print("   Daily sign-in successful!")
         except Exception as e:
-            print(f"❌ Error during basic usage: {e}")
+            print(f"   Daily sign-in failed: {e}")
+
+        print("\n✅ Basic usage example completed successfully!")
 
+    except Exception as e:
+        print(f"❌ Error during basic usage: {e}")
+
+    return resources
 
-async def example_file_operations():
+
+async def example_file_operations(client: BitQiuClient, resources: List[FileResource]):
     """Example of file operations."""
-    print("\n=== File Operations Example ===")
-    
-    with BitQiuClient() as client:
+    out = ["\n=== File Operations Example ==="]
+
+    async def show_download_url(first_file) -> List[str]:
+        out = []
+        # Get download URL for first file
+        out.append(f"1. Getting download URL for: {first_file.name}")
         try:
-            # Assuming client is already authenticated from previous example
-            if not client.is_authenticated:
-                print("Please authenticate first...")
-                client.authenticate_with_qr_code()
-                client.get_user_info()
-            
-            # Get resources for demonstration
-            resources = client.list_resources()
-            files = [r for r in resources if not r.is_directory]
-            directories = [r for r in resources if r.is_directory]
-            
-            if files:
-                # Get download URL for first file
-                first_file = files[0]
-                print(f"1. Getting download URL for: {first_file.name}")
-                try:
-                    download_info = client.get_download_url(first_file.resource_id)
-                    print(f"   File size: {download_info.size} bytes")
-                    print(f"   MD5: {download_info.md5}")
-                    print(f"   Download URL: {download_info.url[:50]}...")
-                except Exception as e:
-                    print(f"   Failed to get download URL: {e}")
-            
-            if len(files) >= 2:
-                # Rename a file
-                second_file = files[1]
-                original_name = second_file.name
-                new_name = f"renamed_{original_name}"
-                print(f"2. Renaming file from '{original_name}' to '{new_name}'...")
-                try:
-                    client.rename_resource(second_file.resource_id, new_name, is_directory=False)
-                    print("   File renamed successfully!")
-                    
-                    # Rename it back
-                    client.rename_resource(second_file.resource_id, original_name, is_directory=False)
-                    print("   File name restored!")
-                except Exception as e:
-                    print(f"   Failed to rename file: {e}")
-            
-            # Create and manage directories
-            print("3. Creating nested directories...")
-            try:
-                parent_dir = client.create_directory("Parent Test Dir")
-                child_dir = client.create_directory("Child Test Dir", parent_dir.dir_id)
-                print(f"   Created: {parent_dir.name} -> {child_dir.name}")
-                
-                # List resources in parent directory
-                child_resources = client.list_resources(parent_dir.dir_id)
-                print(f"   Found {len(child_resources)} items in parent directory")
-                
-            except Exception as e:
-                print(f"   Failed to create directories: {e}")
-            
-            print("✅ File operations example completed!")
-            
+            download_info = await asyncio.to_thread(client.get_download_url, first_file.resource_id)
+            out.append(f"   File size: {download_info.size} bytes")
+            out.append(f"   MD5: {download_info.md5}")
+            out.append(f"   Download URL: {download_info.url[:50]}...")
         except Exception as e:
-            print(f"❌ Error during file operations: {e}")
+            out.append(f"   Failed to get download URL: {e}")
+        return out
+
+    async def rename_and_restore(second_file) -> List[str]:
+        out = []
+        # Rename a file
+        original_name = second_file.name
+        new_name = f"renamed_{original_name}"
+        out.append(f"2. Renaming file from '{original_name}' to '{new_name}'...")
+        try:
+            await asyncio.to_thread(client.rename_resource, second_file.resource_id, new_name, is_directory=False)
+            out.append("   File renamed successfully!")
 
+            # Rename it back
+            await asyncio.to_thread(client.rename_resource, second_file.resource_id, original_name, is_directory=False)
+            out.append("   File name restored!")
+        except Exception as e:
+            out.append(f"   Failed to rename file: {e}")
+        return out
 
-async def example_download_tasks():
-    """Example of adding download tasks."""
-    print("\n=== Download Tasks Example ===")
-    
-    with BitQiuClient() as client:
+    async def create_nested_directories() -> List[str]:
+        out = []
+        # Create and manage directories (the child depends on the parent)
+        out.append("3. Creating nested directories...")
         try:
-            if not client.is_authenticated:
-                print("Please authenticate first...")
-                client.authenticate_with_qr_code()
-                client.get_user_info()
-            
-            # Example download URLs (these are just examples, may not be valid)
-            example_urls = [
-                "magnet:?xt=urn:btih:b2885043be3476443fa568d4a0a1ae009d2ed9e4",
-            ]
-            
-            print(f"Adding {len(example_urls)} download tasks...")
-            try:
-                success = client.add_download_tasks(example_urls)
-                if success:
-                    print("   All download tasks added successfully!")
-                else:
-                    print("   Some download tasks may have failed")
-            except Exception as e:
-                print(f"   Failed to add download tasks: {e}")
-            
-            print("✅ Download tasks example completed!")
-            
+            parent_dir = await asyncio.to_thread(client.create_directory, "Parent Test Dir")
+            child_dir = await asyncio.to_thread(client.create_directory, "Child Test Dir", parent_dir.dir_id)
+            out.append(f"   Created: {parent_dir.name} -> {child_dir.name}")
+
+            # List resources in parent directory
+            child_resources = await asyncio.to_thread(client.list_resources, parent_dir.dir_id, parse_times=False)
+            out.append(f"   Found {len(child_resources)} items in parent directory")
+
         except Exception as e:
-            print(f"❌ Error during download tasks: {e}")
+            out.append(f"   Failed to create directories: {e}")
+        return out
 
+    try:
+        # Split the shared listing in a single pass
+        files, directories = [], []
+        for r in resources:
+            (directories if r.is_directory else files).append(r)
 
-async def example_collection_management():
-    """Example of collection management."""
-    print("\n=== Collection Management Example ===")
-    
-    with BitQiuClient() as client:
+        # The three operations are independent, so issue them concurrently;
+        # each returns its own lines, which are kept in step order
+        operations = []
+        if files:
+            operations.append(show_download_url(files[0]))
+        if len(files) >= 2:
+            operations.append(rename_and_restore(files[1]))
+        operations.append(create_nested_directories())
+        for lines in await asyncio.gather(*operations):
+            out.extend(lines)
+
+        out.append("✅ File operations example completed!")
+
+    except Exception as e:
+        out.append(f"❌ Error during file operations: {e}")
+
+    print("\n".join(out))
+
+
+async def example_download_tasks(client: BitQiuClient):
+    """Example of adding download tasks."""
+    out = ["\n=== Download Tasks Example ==="]
+
+    try:
+        # Example download URLs (these are just examples, may not be valid)
+        example_urls = [
+            "magnet:?xt=urn:btih:b2885043be3476443fa568d4a0a1ae009d2ed9e4",
+        ]
+
+        out.append(f"Adding {len(example_urls)} download tasks...")
         try:
-            if not client.is_authenticated:
-                print("Please authenticate first...")
-                client.authenticate_with_qr_code()
-                client.get_user_info()
-            
-            resources = client.list_resources()
-            if resources:
-                # Add to collection
-                first_resource = resources[0]
-                print(f"1. Adding '{first_resource.name}' to collection...")
-                try:
-                    if first_resource.is_directory:
-                        client.manage_collection(True, dir_ids=[first_resource.resource_id])
-                    else:
-                        client.manage_collection(True, file_ids=[first_resource.resource_id])
-                    print("   Added to collection successfully!")
-                    
-                    # Remove from collection
-                    print("2. Removing from collection...")
-                    if first_resource.is_directory:
-                        client.manage_collection(False, dir_ids=[first_resource.resource_id])
-                    else:
-                        client.manage_collection(False, file_ids=[first_resource.resource_id])
-                    print("   Removed from collection successfully!")
-                    
-                except Exception as e:
-                    print(f"   Collection management failed: {e}")
-            
-            print("✅ Collection management example completed!")
-            
+            success = await asyncio.to_thread(client.add_download_tasks, example_urls)
+            if success:
+                out.append("   All download tasks added successfully!")
+            else:
+                out.append("   Some download tasks may have failed")
         except Exception as e:
-            print(f"❌ Error during collection management: {e}")
+            out.append(f"   Failed to add download tasks: {e}")
+
+        out.append("✅ Download tasks example completed!")
+
+    except Exception as e:
+        out.append(f"❌ Error during download tasks: {e}")
+
+    print("\n".join(out))
+
+
+async def example_collection_management(client: BitQiuClient, resources: List[FileResource]):
+    """Example of collection management."""
+    out = ["\n=== Collection Management Example ==="]
+
+    try:
+        if resources:
+            # Add to collection
+            first_resource = resources[0]
+            if first_resource.is_directory:
+                ids = {"dir_ids": [first_resource.resource_id]}
+            else:
+                ids = {"file_ids": [first_resource.resource_id]}
+
+            out.append(f"1. Adding '{first_resource.name}' to collection...")
+            try:
+                await asyncio.to_thread(client.manage_collection, True, **ids)
+                out.append("   Added to collection successfully!")
+
+                # Remove from collection
+                out.append("2. Removing from collection...")
+                await asyncio.to_thread(client.manage_collection, False, **ids)
+                out.append("   Removed from collection successfully!")
+
+            except Exception as e:
+                out.append(f"   Collection management failed: {e}")
+
+        out.append("✅ Collection management example completed!")
+
+    except Exception as e:
+        out.append(f"❌ Error during collection management: {e}")
+
+    print("\n".join(out))
 
 
 async def main():
     """Run all examples."""
     print("BitQiu Client Examples")
     print("=" * 50)
-    
+
     try:
-        await example_basic_usage()
-        await example_file_operations()
-        await example_download_tasks()
-        await example_collection_management()
-        
+        # Share one client so the QR login only has to happen once
+        with BitQiuClient() as client:
+            # The root listing is fetched once and shared by every example
+            resources = await example_basic_usage(client)
+            if not client.is_authenticated:
+                print("\n❌ Authentication failed, skipping remaining examples")
+                return
+
+            # The remaining examples are independent of each other
+            await asyncio.gather(
+                example_file_operations(client, resources),
+                example_download_tasks(client),
+                example_collection_management(client, resources),
+            )
+
         print("\n🎉 All examples completed!")
-        
+
     except KeyboardInterrupt:
         print("\n⚠️  Examples interrupted by user")
     except Exception as e:
@@ -9,16 +9,26 @@ Designed with MCP (Model Context Protocol) server integration in mind.
 
 import os
 import time
+import asyncio
 import json
 import hashlib
 import logging
-from typing import List, Dict, Tuple, Optional, Union, Any
-from urllib.parse import quote_plus
+import functools
+import contextlib
+from typing import List, Dict, Tuple, Optional, Union, Any, Iterator, AsyncIterator
+from urllib.parse import quote_plus, urlencode
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
 
 import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 
 logging.basicConfig(level=logging.INFO)
@@ -28,11 +38,25 @@ logger = logging.getLogger(__name__)
 class BitQiuConfig:
     """Configuration constants for BitQiu API."""
     
-    QR_CODE_API = "https://api.qrserver.com/v1/create-qr-code/?data={}"
+    QR_CODE_PREFIX = "https://api.qrserver.com/v1/create-qr-code/?data="
     HOST_URL = "https://pan.bitqiu.com"
     ORG_CHANNEL = "default|default|stpan"
     SUCCESS_CODE = "10200"
     
+    # URL schemes accepted by cloud download tasks
+    DOWNLOAD_URL_SCHEMES = ("magnet:", "ed2k://")
+    
+    # Pre-encoded form body for requests that only carry the org channel
+    ORG_CHANNEL_FORM = urlencode({"org_channel": ORG_CHANNEL}).encode()
+    FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+    
+    # QR login polling: back off from the minimum to the maximum interval
+    # by QR_POLL_STEP seconds per attempt (all values in seconds)
+    QR_LOGIN_TIMEOUT = 300.0
+    QR_POLL_MIN_INTERVAL = 1.0
+    QR_POLL_MAX_INTERVAL = 5.0
+    QR_POLL_STEP = 1.0
+    
     # API Endpoints
     ENDPOINTS = {
         "qr_code": "/loginServer/getQRCode",
@@ -55,6 +79,10 @@ class BitQiuConfig:
         "signin": "/integral/randomSignin",
     }
 
+    # Absolute endpoint URLs, joined once so requests don't rebuild them.
+    # map() instead of a comprehension: comprehensions in a class body can't see HOST_URL
+    ABSOLUTE_ENDPOINTS = dict(zip(ENDPOINTS, map(HOST_URL.__add__, ENDPOINTS.values())))
+
 
 class ResourceType(Enum):
     """Resource type enumeration."""
@@ -70,7 +98,7 @@ class TaskStatus(Enum):
     FAILED = "3"
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthSession:
     """Authentication session data."""
     cloud_web_sid: str = ""
@@ -89,8 +117,7 @@ class UserPrivilege(BaseModel):
     cloud_doc_play_count_remain: int = Field(alias="cloudDocPlayCountRemain")
     privileged_gear_name: str = Field(alias="privilegedGearName")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True, extra="ignore")
 
 
 class UserInfo(BaseModel):
@@ -99,18 +126,26 @@ class UserInfo(BaseModel):
     root_dir_id: str = Field(alias="rootDirId")
     privilege: UserPrivilege = Field(alias="privilege")
     
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True, extra="ignore")
 
 
 class FileResource(BaseModel):
-    """File resource model."""
+    """
+    File resource model.
+    
+    create_time and update_time are always set, except for resources listed
+    with parse_times=False, where both are None.
+    """
     resource_id: str
     name: str
     size: Optional[int] = None
     is_directory: bool
-    create_time: int
-    update_time: int
+    create_time: Optional[int] = None
+    update_time: Optional[int] = None
+
+
+# Validates a whole page of resources in one pydantic-core call
+_FILE_RESOURCE_LIST = TypeAdapter(List[FileResource])
 
 
 class DirectoryInfo(BaseModel):
@@ -159,7 +194,20 @@ class BitQiuClient:
             timeout: Request timeout in seconds
         """
         self._session = AuthSession()
-        self._http_client = httpx.Client(timeout=timeout)
+        # HTTP/2 plus a warm keep-alive pool, so paginated listing and QR
+        # polling reuse one connection instead of reconnecting each time
+        self._http_limits = httpx.Limits(
+            max_connections=20,
+            max_keepalive_connections=20,
+            keepalive_expiry=60.0
+        )
+        self._http_client = httpx.Client(
+            timeout=timeout,
+            http2=True,
+            limits=self._http_limits
+        )
+        # Created on first async listing, see _get_async_http_client()
+        self._async_http_client: Optional[httpx.AsyncClient] = None
         self._config = BitQiuConfig()
 
     def __enter__(self):
@@ -170,10 +218,42 @@ class BitQiuClient:
         """Context manager exit."""
         self.close()
 
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+
     def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client. Use aclose() if async listing was used."""
         self._http_client.close()
 
+    async def aclose(self):
+        """Close both the sync and the async HTTP clients."""
+        if self._async_http_client is not None:
+            await self._async_http_client.aclose()
+            self._async_http_client = None
+        self._http_client.close()
+
+    def _get_async_http_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared async HTTP client, creating it on first use.
+        
+        It is bound to the event loop that first uses it. Session cookies are
+        copied over from the sync client on every call, so a login made after
+        creation is picked up.
+        """
+        if self._async_http_client is None:
+            self._async_http_client = httpx.AsyncClient(
+                timeout=self._http_client.timeout,
+                http2=True,
+                limits=self._http_limits
+            )
+        self._async_http_client.cookies = self._http_client.cookies
+        return self._async_http_client
+
     @staticmethod
     def calculate_file_md5(file_path: str) -> str:
         """
@@ -191,29 +271,62 @@ class BitQiuClient:
         if not os.path.isfile(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        md5_hash = hashlib.md5()
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                md5_hash.update(chunk)
-        return md5_hash.hexdigest()
+            return hashlib.file_digest(f, "md5").hexdigest()
+
+    @staticmethod
+    def calculate_file_md5_batch(file_paths: List[str]) -> List[str]:
+        """
+        Calculate MD5 hashes of several files concurrently.
+        
+        Hashing releases the GIL, so the files are hashed in parallel threads.
+        
+        Args:
+            file_paths: Paths to the files
+            
+        Returns:
+            MD5 hashes as hex strings, in the same order as file_paths
+            
+        Raises:
+            FileNotFoundError: If any file doesn't exist
+        """
+        if len(file_paths) <= 1:
+            return [BitQiuClient.calculate_file_md5(path) for path in file_paths]
+
+        max_workers = min(len(file_paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(BitQiuClient.calculate_file_md5, file_paths))
 
     @staticmethod
     def get_timestamp_ms() -> int:
         """Get current timestamp in milliseconds."""
-        return int(round(time.time() * 1000))
+        return time.time_ns() // 1_000_000
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def datetime_to_timestamp_ms(datetime_str: str = "2023-01-01 00:00:00") -> int:
         """
         Convert datetime string to timestamp in milliseconds.
         
+        Results are cached, since listings repeat the same timestamps often.
+        
         Args:
             datetime_str: Datetime string in format "YYYY-MM-DD HH:MM:SS"
             
         Returns:
             Timestamp in milliseconds
         """
-        return int(round(time.mktime(time.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")) * 1000))
+        # Second-resolution input, so integer scaling is exact
+        return int(datetime.fromisoformat(datetime_str).timestamp()) * 1000
+
+    @staticmethod
+    def _join_ids(ids: List[str]) -> str:
+        """Join resource IDs into the comma-separated form the API expects."""
+        if not ids:
+            return ""
+        if len(ids) == 1:
+            return ids[0]
+        return ",".join(ids)
 
     def _parse_response(self, response: httpx.Response) -> Tuple[bool, str, Dict[str, Any]]:
         """
@@ -232,7 +345,7 @@ class BitQiuClient:
             if response.status_code != 200:
                 raise ApiError(f"HTTP {response.status_code}: {response.text}")
             
-            json_data = response.json()
+            json_data = _json_loads(response.content)
             success = json_data.get("code") == self._config.SUCCESS_CODE
             message = str(json_data.get("message", ""))
             data = json_data.get("data") or {}
@@ -242,19 +355,19 @@ class BitQiuClient:
         except (json.JSONDecodeError, KeyError) as e:
             raise ApiError(f"Failed to parse response: {e}")
 
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Tuple[bool, str, Dict[str, Any]]:
+    def _make_request(self, method: str, endpoint_key: str, **kwargs) -> Tuple[bool, str, Dict[str, Any]]:
         """
         Make HTTP request to BitQiu API.
         
         Args:
             method: HTTP method
-            endpoint: API endpoint
+            endpoint_key: Key of the API endpoint in BitQiuConfig.ENDPOINTS
             **kwargs: Additional request parameters
             
         Returns:
             Parsed response tuple
         """
-        url = f"{self._config.HOST_URL}{endpoint}"
+        url = self._config.ABSOLUTE_ENDPOINTS[endpoint_key]
         response = self._http_client.request(method, url, **kwargs)
         return self._parse_response(response)
 
@@ -271,7 +384,7 @@ class BitQiuClient:
         # Get QR code
         success, message, data = self._make_request(
             "GET", 
-            self._config.ENDPOINTS["qr_code"],
+            "qr_code",
             params={
                 "org_channel": self._config.ORG_CHANNEL, 
                 "_": self.get_timestamp_ms()
@@ -282,25 +395,29 @@ class BitQiuClient:
             raise AuthenticationError(f"Failed to get QR code: {message}")
 
         verify_code = data["code"]
-        qr_url = self._config.QR_CODE_API.format(data["url"])
+        qr_url = self._config.QR_CODE_PREFIX + data["url"]
         
         logger.info(f"Please scan the QR code: {qr_url}")
 
-        # Poll for login confirmation (5 minutes timeout)
+        # Poll for login confirmation until QR_LOGIN_TIMEOUT
         params = {
             "org_channel": self._config.ORG_CHANNEL,
             "_": self.get_timestamp_ms(),
             "code": verify_code
         }
         
-        for attempt in range(60):  # 5 minutes with 5-second intervals
-            time.sleep(5)
+        deadline = time.monotonic() + self._config.QR_LOGIN_TIMEOUT
+        interval = self._config.QR_POLL_MIN_INTERVAL
+        
+        while time.monotonic() < deadline:
+            # Poll quickly right after the QR code is shown, then slow down
+            time.sleep(interval)
+            interval = min(interval + self._config.QR_POLL_STEP, self._config.QR_POLL_MAX_INTERVAL)
             logger.info("Waiting for login confirmation...")
             
             response = self._http_client.get(
-                f"{self._config.HOST_URL}{self._config.ENDPOINTS['qr_code_info']}",
-                params=params,
-                timeout=None
+                self._config.ABSOLUTE_ENDPOINTS["qr_code_info"],
+                params=params
             )
             
             success, message, data = self._parse_response(response)
@@ -317,7 +434,10 @@ class BitQiuClient:
                 logger.info("Authentication successful!")
                 return True
 
-        raise AuthenticationError("Authentication timeout - QR code not scanned within 5 minutes")
+        raise AuthenticationError(
+            f"Authentication timeout - QR code not scanned within "
+            f"{self._config.QR_LOGIN_TIMEOUT:g} seconds"
+        )
 
     def get_user_info(self) -> UserInfo:
         """
@@ -335,8 +455,9 @@ class BitQiuClient:
 
         success, message, data = self._make_request(
             "POST",
-            self._config.ENDPOINTS["user_info"],
-            data={"org_channel": self._config.ORG_CHANNEL}
+            "user_info",
+            content=self._config.ORG_CHANNEL_FORM,
+            headers=self._config.FORM_HEADERS
         )
         
         if not success:
@@ -348,7 +469,8 @@ class BitQiuClient:
         return user_info
 
     def list_resources(self, parent_dir: Optional[str] = None, 
-                      order_by: str = "name", ascending: bool = True) -> List[FileResource]:
+                      order_by: str = "name", ascending: bool = True,
+                      parse_times: bool = True) -> List[FileResource]:
         """
         List resources in a directory.
         
@@ -356,61 +478,190 @@ class BitQiuClient:
             parent_dir: Parent directory ID (None for root)
             order_by: Sort field ("name", "updateTime", "size")
             ascending: Sort order
+            parse_times: Convert create/update times; skip it when only
+                names, IDs or sizes are needed
             
         Returns:
             List of file resources
         """
-        if not self._session.user_root_dir:
-            raise AuthenticationError("User info not loaded - call get_user_info() first")
+        return list(self.iter_resources(parent_dir, order_by, ascending, parse_times))
 
-        parent_id = parent_dir or self._session.user_root_dir
+    def iter_resources(self, parent_dir: Optional[str] = None,
+                       order_by: str = "name", ascending: bool = True,
+                       parse_times: bool = True) -> Iterator[FileResource]:
+        """
+        Iterate resources in a directory, fetching pages on demand.
         
-        payload = {
-            "org_channel": self._config.ORG_CHANNEL,
-            "parentId": parent_id,
-            "userId": self._session.user_id,
-            "name": "undefined",
-            "limit": "24",
-            "model": "1",
-            "orderType": order_by,
-            "desc": "0" if ascending else "1",
-            "currentPage": "1",
-            "page": "1"
-        }
-
-        all_resources = []
+        Only one page is held at a time, and callers that stop early skip
+        the requests for the remaining pages.
+        
+        Args:
+            parent_dir: Parent directory ID (None for root)
+            order_by: Sort field ("name", "updateTime", "size")
+            ascending: Sort order
+            parse_times: Convert create/update times; skip it when only
+                names, IDs or sizes are needed
+            
+        Returns:
+            Iterator of file resources
+        """
+        payload = self._resource_pages_payload(parent_dir, order_by, ascending)
+        return self._iter_resource_pages(payload, parse_times)
+
+    def _iter_resource_pages(self, payload: Dict[str, str], parse_times: bool) -> Iterator[FileResource]:
+        """Yield resources page by page, starting from the given payload."""
+        # Bind loop-invariant lookups to locals once
+        make_request = self._make_request
+        parse_resources = self._parse_resources
+        current_page = 1
         
         while True:
-            success, message, data = self._make_request(
+            success, message, data = make_request(
                 "POST",
-                self._config.ENDPOINTS["resource_pages"],
+                "resource_pages",
                 data=payload
             )
             
             if not success:
                 raise ApiError(f"Failed to list resources: {message}")
 
-            # Parse resources
-            for item in data.get("data", []):
-                resource = FileResource(
-                    resource_id=item["resourceId"],
-                    name=item["name"],
-                    size=item["size"],
-                    is_directory=bool(item.get("dirType") is not None),
-                    create_time=self.datetime_to_timestamp_ms(item["createTime"]),
-                    update_time=self.datetime_to_timestamp_ms(item["updateTime"])
-                )
-                all_resources.append(resource)
+            yield from parse_resources(data.get("data", []), parse_times)
 
             if not data.get("hasNext", False):
                 break
                 
             # Next page
-            current_page = int(payload["currentPage"]) + 1
-            payload["page"] = str(current_page)
-            payload["currentPage"] = str(current_page)
+            current_page += 1
+            payload["page"] = payload["currentPage"] = str(current_page)
+
+    async def list_resources_async(self, parent_dir: Optional[str] = None,
+                                   order_by: str = "name", ascending: bool = True,
+                                   parse_times: bool = True) -> List[FileResource]:
+        """
+        List resources in a directory with fetching and parsing pipelined.
+        
+        A background task pages through the listing and hands raw pages over
+        a bounded queue, while this side turns them into models. From page 2
+        on, page N+1 is requested while page N is still in flight, so round
+        trips overlap each other as well as the parsing.
+        
+        Connections are reused across calls through one async HTTP client;
+        close it with aclose() (or use the client as an async context manager).
+        
+        Args:
+            parent_dir: Parent directory ID (None for root)
+            order_by: Sort field ("name", "updateTime", "size")
+            ascending: Sort order
+            parse_times: Convert create/update times; skip it when only
+                names, IDs or sizes are needed
+            
+        Returns:
+            List of file resources
+        """
+        payload = self._resource_pages_payload(parent_dir, order_by, ascending)
+        async with contextlib.aclosing(self._aiter_resource_pages(payload, parse_times)) as resources:
+            return [resource async for resource in resources]
+
+    async def _aiter_resource_pages(self, payload: Dict[str, str],
+                                    parse_times: bool) -> AsyncIterator[FileResource]:
+        """
+        Yield resources from a producer task that fetches pages ahead.
+        
+        The producer is only cancelled when the generator is closed, so callers
+        that may stop early must wrap it in contextlib.aclosing().
+        """
+        url = self._config.ABSOLUTE_ENDPOINTS["resource_pages"]
+        client = self._get_async_http_client()
+        # Raw page items, then None at the end or the exception that stopped paging
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+        async def fetch_page(page: int) -> Tuple[bool, str, Dict[str, Any]]:
+            response = await client.post(
+                url,
+                data={**payload, "currentPage": str(page), "page": str(page)}
+            )
+            return self._parse_response(response)
+
+        async def produce() -> None:
+            page = 1
+            current = asyncio.create_task(fetch_page(page))
+            # Only speculate once the listing is known to span several pages,
+            # so a single-page directory costs exactly one request
+            prefetch = False
+            try:
+                while True:
+                    # Rotate before awaiting so the finally block always sees
+                    # the in-flight task
+                    previous = current
+                    if prefetch:
+                        current = asyncio.create_task(fetch_page(page + 1))
+                    success, message, data = await previous
+
+                    if not success:
+                        raise ApiError(f"Failed to list resources: {message}")
+
+                    await queue.put(data.get("data", []))
+
+                    if not data.get("hasNext", False):
+                        break
+                    page += 1
+                    if not prefetch:
+                        current = asyncio.create_task(fetch_page(page))
+                        prefetch = True
+                await queue.put(None)
+            except Exception as e:
+                await queue.put(e)
+            finally:
+                # Discard the speculative request past the last page
+                current.cancel()
+                await asyncio.gather(current, return_exceptions=True)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (items := await queue.get()) is not None:
+                if isinstance(items, Exception):
+                    raise items
+                for resource in self._parse_resources(items, parse_times):
+                    yield resource
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    def _resource_pages_payload(self, parent_dir: Optional[str],
+                                order_by: str, ascending: bool) -> Dict[str, str]:
+        """Build the first-page request payload for resource listing."""
+        if not self._session.user_root_dir:
+            raise AuthenticationError("User info not loaded - call get_user_info() first")
+
+        parent_id = parent_dir or self._session.user_root_dir
+        
+        return {
+            "org_channel": self._config.ORG_CHANNEL,
+            "parentId": parent_id,
+            "userId": self._session.user_id,
+            "name": "undefined",
+            "limit": "24",
+            "model": "1",
+            "orderType": order_by,
+            "desc": "0" if ascending else "1",
+            "currentPage": "1",
+            "page": "1"
+        }
 
-        return all_resources
+    def _parse_resources(self, items: List[Dict[str, Any]], parse_times: bool = True) -> List[FileResource]:
+        """Convert one page of raw resource items into models."""
+        to_timestamp_ms = self.datetime_to_timestamp_ms
+        return _FILE_RESOURCE_LIST.validate_python([
+            {
+                "resource_id": item["resourceId"],
+                "name": item["name"],
+                "size": item["size"],
+                "is_directory": item.get("dirType") is not None,
+                "create_time": to_timestamp_ms(item["createTime"]) if parse_times else None,
+                "update_time": to_timestamp_ms(item["updateTime"]) if parse_times else None
+            }
+            for item in items
+        ])
 
     def list_directories(self, parent_dir: Optional[str] = None) -> List[DirectoryInfo]:
         """
@@ -436,7 +687,7 @@ class BitQiuClient:
 
         success, message, data = self._make_request(
             "POST",
-            self._config.ENDPOINTS["resource_list"],
+            "resource_list",
             data=payload
         )
         
@@ -482,7 +733,7 @@ class BitQiuClient:
 
         success, message, data = self._make_request(
             "POST",
-            self._config.ENDPOINTS["resource_create"],
+            "resource_create",
             data=payload
         )
         
@@ -513,7 +764,7 @@ class BitQiuClient:
 
         success, message, data = self._make_request(
             "POST",
-            self._config.ENDPOINTS["download_url"],
+            "download_url",
             data=payload
         )
         
@@ -542,13 +793,13 @@ class BitQiuClient:
         
         payload = {
             "org_channel": self._config.ORG_CHANNEL,
-            "dirIds": ",".join(dir_ids),
-            "fileIds": ",".join(file_ids)
+            "dirIds": self._join_ids(dir_ids),
+            "fileIds": self._join_ids(file_ids)
         }
 
         success, message, data = self._make_request(
             "POST",
-            self._config.ENDPOINTS["resource_delete"],
+            "resource_delete",
             data=payload
         )
         
@@ -578,7 +829,7 @@ class BitQiuClient:
 
         success, message, data = self._make_request(
             "POST",
-            self._config.ENDPOINTS["resource_rename"],
+            "resource_rename",
             data=payload
         )
         
@@ -614,13 +865,13 @@ class BitQiuClient:
         payload = {
             "org_channel": self._config.ORG_CHANNEL,
             "parentId": target_id,
-            "dirIds": ",".join(dir_ids),
-            "fileIds": ",".join(file_ids)
+            "dirIds": self._join_ids(dir_ids),
+            "fileIds": self._join_ids(file_ids)
         }
 
         success, message, data = self._make_request(
             "POST",
-            self._config.ENDPOINTS["resource_move"],
+            "resource_move",
             data=payload
         )
         
@@ -652,13 +903,13 @@ class BitQiuClient:
         payload = {
             "org_channel": self._config.ORG_CHANNEL,
             "parentId": target_id,
-            "dirIds": ",".join(dir_ids),
-            "fileIds": ",".join(file_ids)
+            "dirIds": self._join_ids(dir_ids),
+            "fileIds": self._join_ids(file_ids)
         }
 
         success, message, data = self._make_request(
             "POST",
-            self._config.ENDPOINTS["resource_copy"],
+            "resource_copy",
             data=payload
         )
         
@@ -683,15 +934,15 @@ class BitQiuClient:
         dir_ids = dir_ids or []
         file_ids = file_ids or []
         
-        endpoint = self._config.ENDPOINTS["collection_add" if add_to_collection else "collection_cancel"]
+        endpoint_key = "collection_add" if add_to_collection else "collection_cancel"
         
         payload = {
             "org_channel": self._config.ORG_CHANNEL,
-            "dirIds": ",".join(dir_ids),
-            "fileIds": ",".join(file_ids)
+            "dirIds": self._join_ids(dir_ids),
+            "fileIds": self._join_ids(file_ids)
         }
 
-        success, message, data = self._make_request("POST", endpoint, data=payload)
+        success, message, data = self._make_request("POST", endpoint_key, data=payload)
         
         if not success:
             action = "add to" if add_to_collection else "remove from"
@@ -706,12 +957,11 @@ class BitQiuClient:
         Returns:
             True if successful
         """
-        payload = {"org_channel": self._config.ORG_CHANNEL}
-
         success, message, data = self._make_request(
             "POST",
-            self._config.ENDPOINTS["signin"],
-            data=payload
+            "signin",
+            content=self._config.ORG_CHANNEL_FORM,
+            headers=self._config.FORM_HEADERS
         )
         
         if not success:
@@ -735,7 +985,7 @@ class BitQiuClient:
         """
         # Only allow magnet or ed2k links
         for url in urls:
-            if not (url.startswith("magnet:") or url.startswith("ed2k://")):
+            if not url.startswith(self._config.DOWNLOAD_URL_SCHEMES):
                 raise ValueError("Only magnet or ed2k links are allowed")
 
         if len(urls) > 20:
@@ -748,12 +998,13 @@ class BitQiuClient:
             "org_channel": self._config.ORG_CHANNEL,
             "userId": self._session.user_id,
             "dirId": target_dir or "", # '云下载'
-            "downloadUrls": json.dumps([quote_plus(url) for url in urls])
+            # Quoted URLs never need JSON escaping, so build the array directly
+            "downloadUrls": "[" + ",".join(f'"{quote_plus(url)}"' for url in urls) + "]"
         }
 
         success, message, data = self._make_request(
             "POST",
-            self._config.ENDPOINTS["task_add"],
+            "task_add",
             data=payload
         )
         
@@ -0,0 +1,179 @@
+"""Tests for the pipelined async resource listing."""
+
+import asyncio
+import contextlib
+import gc
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from mcp_bitqiu import ApiError, BitQiuClient, BitQiuConfig
+
+
+def _page_of(request: httpx.Request) -> int:
+    return int(parse_qs(request.content.decode())["currentPage"][0])
+
+
+def _page_response(page: int, pages: int) -> httpx.Response:
+    items = [
+        {
+            "resourceId": f"{page}-{i}",
+            "name": f"item {page}-{i}",
+            "size": i,
+            "dirType": 1 if i == 0 else None,
+            "createTime": "2024-01-01 00:00:00",
+            "updateTime": "2024-01-02 00:00:00",
+        }
+        for i in range(3)
+    ]
+    return httpx.Response(200, json={
+        "code": BitQiuConfig.SUCCESS_CODE,
+        "message": "",
+        "data": {"data": items, "hasNext": page < pages},
+    })
+
+
+def _client(handler) -> BitQiuClient:
+    client = BitQiuClient()
+    client._session.user_root_dir = "root"
+    client._async_http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def _run(coro):
+    """Run a coroutine, failing on any exception asyncio had to log."""
+    errors = []
+
+    async def main():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+        try:
+            return await coro
+        finally:
+            # Surface "Task exception was never retrieved" from dropped tasks
+            gc.collect()
+            await asyncio.sleep(0)
+
+    result = asyncio.run(main())
+    assert errors == []
+    return result
+
+
+def test_multi_page_listing_keeps_order():
+    requested = []
+
+    def handler(request):
+        page = _page_of(request)
+        requested.append(page)
+        return _page_response(page, pages=3)
+
+    async def scenario():
+        async with _client(handler) as client:
+            return await client.list_resources_async()
+
+    resources = _run(scenario())
+
+    assert [r.resource_id for r in resources] == [f"{p}-{i}" for p in (1, 2, 3) for i in range(3)]
+    assert resources[0].is_directory and not resources[1].is_directory
+    # Pages 2 onwards are prefetched, so one request goes past the last page
+    assert sorted(requested) == [1, 2, 3, 4]
+
+
+def test_single_page_listing_makes_one_request_on_a_reused_client():
+    requested = []
+
+    def handler(request):
+        requested.append(_page_of(request))
+        return _page_response(1, pages=1)
+
+    async def scenario():
+        async with _client(handler) as client:
+            async_client = client._async_http_client
+            await client.list_resources_async()
+            await client.list_resources_async()
+            assert client._async_http_client is async_client
+        assert client._async_http_client is None
+
+    _run(scenario())
+
+    assert requested == [1, 1]
+
+
+def test_api_error_on_later_page_is_raised():
+    def handler(request):
+        page = _page_of(request)
+        if page == 2:
+            return httpx.Response(200, json={"code": "500", "message": "boom"})
+        return _page_response(page, pages=5)
+
+    async def scenario():
+        async with _client(handler) as client:
+            await client.list_resources_async()
+
+    with pytest.raises(ApiError, match="Failed to list resources: boom"):
+        _run(scenario())
+
+
+def test_non_200_response_is_raised():
+    def handler(request):
+        page = _page_of(request)
+        if page == 2:
+            return httpx.Response(502, text="bad gateway")
+        return _page_response(page, pages=5)
+
+    async def scenario():
+        async with _client(handler) as client:
+            await client.list_resources_async()
+
+    with pytest.raises(ApiError, match="HTTP 502"):
+        _run(scenario())
+
+
+def test_transport_error_is_raised_without_leaking_prefetch():
+    async def handler(request):
+        page = _page_of(request)
+        if page == 2:
+            await asyncio.sleep(0.01)
+            raise httpx.ConnectError("page 2 down")
+        if page > 2:
+            raise httpx.ConnectError(f"page {page} down")
+        return _page_response(page, pages=5)
+
+    async def scenario():
+        async with _client(handler) as client:
+            await client.list_resources_async()
+
+    with pytest.raises(httpx.ConnectError, match="page 2 down"):
+        _run(scenario())
+
+
+def test_early_close_cancels_producer_and_prefetch():
+    completed = []
+    cancelled = []
+
+    async def handler(request):
+        page = _page_of(request)
+        if page > 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(page)
+                raise
+        completed.append(page)
+        return _page_response(page, pages=5)
+
+    async def scenario():
+        async with _client(handler) as client:
+            payload = client._resource_pages_payload(None, "name", True)
+            async with contextlib.aclosing(client._aiter_resource_pages(payload, True)) as resources:
+                first = await resources.__anext__()
+                # Let the producer start its page requests
+                await asyncio.sleep(0.01)
+            assert asyncio.all_tasks() == {asyncio.current_task()}
+            return first
+
+    first = _run(scenario())
+
+    assert first.resource_id == "1-0"
+    assert completed == [1]
+    assert sorted(cancelled) == [2, 3]
@@ -0,0 +1,43 @@
+"""Tests for BitQiuClient.add_download_tasks request building."""
+
+import json
+from urllib.parse import parse_qs, quote_plus
+
+import httpx
+import pytest
+
+from mcp_bitqiu import BitQiuClient
+
+
+@pytest.fixture
+def captured():
+    return []
+
+
+@pytest.fixture
+def client(captured):
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.append({k: v[0] for k, v in parse_qs(request.content.decode()).items()})
+        return httpx.Response(200, json={"code": "10200", "data": {"success": ["ok"]}})
+
+    client = BitQiuClient()
+    client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    client._session.user_id = "user"
+    yield client
+    client.close()
+
+
+def test_download_urls_are_a_json_array_of_quoted_urls(client, captured):
+    urls = [
+        "magnet:?xt=urn:btih:b2885043be3476443fa568d4a0a1ae009d2ed9e4&dn=a name",
+        'ed2k://|file|"quoted" é.mkv|123|ABC|/',
+    ]
+
+    assert client.add_download_tasks(urls) is False  # one success for two URLs
+    assert json.loads(captured[0]["downloadUrls"]) == [quote_plus(url) for url in urls]
+
+
+def test_rejects_unsupported_schemes(client, captured):
+    with pytest.raises(ValueError):
+        client.add_download_tasks(["https://example.com/file"])
+    assert captured == []
@@ -0,0 +1,59 @@
+"""Tests for BitQiuClient file hashing helpers."""
+
+import hashlib
+
+import pytest
+
+from mcp_bitqiu import BitQiuClient
+
+
+def _write(tmp_path, name: str, content: bytes) -> str:
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_calculate_file_md5_matches_hashlib(tmp_path):
+    content = bytes(range(256)) * 5000
+    path = _write(tmp_path, "data.bin", content)
+
+    assert BitQiuClient.calculate_file_md5(path) == hashlib.md5(content).hexdigest()
+
+
+def test_calculate_file_md5_empty_file(tmp_path):
+    path = _write(tmp_path, "empty.bin", b"")
+
+    assert BitQiuClient.calculate_file_md5(path) == hashlib.md5().hexdigest()
+
+
+def test_calculate_file_md5_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        BitQiuClient.calculate_file_md5(str(tmp_path / "missing.bin"))
+
+
+def test_calculate_file_md5_batch_empty():
+    assert BitQiuClient.calculate_file_md5_batch([]) == []
+
+
+def test_calculate_file_md5_batch_single(tmp_path):
+    path = _write(tmp_path, "one.bin", b"one")
+
+    assert BitQiuClient.calculate_file_md5_batch([path]) == [hashlib.md5(b"one").hexdigest()]
+
+
+def test_calculate_file_md5_batch_preserves_order(tmp_path):
+    contents = [f"file {i}".encode() * (i + 1) for i in range(10)]
+    paths = [_write(tmp_path, f"f{i}.bin", content) for i, content in enumerate(contents)]
+
+    assert BitQiuClient.calculate_file_md5_batch(paths) == [
+        hashlib.md5(content).hexdigest() for content in contents
+    ]
+
+
+def test_calculate_file_md5_batch_missing_middle_file(tmp_path):
+    first = _write(tmp_path, "first.bin", b"first")
+    last = _write(tmp_path, "last.bin", b"last")
+    missing = str(tmp_path / "missing.bin")
+
+    with pytest.raises(FileNotFoundError, match="missing.bin"):
+        BitQiuClient.calculate_file_md5_batch([first, missing, last])